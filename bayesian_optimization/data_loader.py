@@ -4,22 +4,49 @@ Parses processed MoTeC CSV files from the data folder
 """
 
 import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
+import pandas as pd
 
 
-def load_csv_file(filepath: Path, columns: List[str]) -> Optional[Dict[str, np.ndarray]]:
+def load_csv_file(
+    filepath: Path,
+    columns: List[str],
+    chunksize: Optional[int] = None,
+) -> Optional[Dict[str, np.ndarray]]:
     """
     Load a single CSV file and extract specified columns.
 
     Args:
         filepath: Path to the CSV file
         columns: List of column names to extract
+        chunksize: If set, parse this many rows at a time to bound peak
+            memory on very large logs (None = read the whole file at once)
 
     Returns:
         Dictionary mapping column names to numpy arrays, or None if file is invalid
     """
+    file_data, message = _read_csv_file(filepath, columns, chunksize)
+    if message is not None:
+        print(message)
+    return file_data
+
+
+def _read_csv_file(
+    filepath: Path,
+    columns: List[str],
+    chunksize: Optional[int] = None,
+) -> Tuple[Optional[Dict[str, np.ndarray]], Optional[str]]:
+    """
+    Worker for load_csv_file that returns its warning or error message
+    instead of printing it, so load_csv_files can report files in order.
+
+    Returns:
+        Tuple of (column arrays or None if file is invalid, message or None)
+    """
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
@@ -31,38 +58,61 @@ def load_csv_file(filepath: Path, columns: List[str]) -> Optional[Dict[str, np.n
             # Row 2: Units (skip for now, but could be useful)
             units = next(reader)
 
-            # Find column indices
-            col_indices = {}
-            for col in columns:
-                if col in headers:
-                    col_indices[col] = headers.index(col)
-                else:
-                    print(
-                        f"Warning: Column '{col}' not found in {filepath.name}")
-                    return None
-
-            # Read data rows
-            data = {col: [] for col in columns}
-            for row in reader:
-                if not row or all(cell.strip() == '' for cell in row):
-                    continue
-
-                for col, idx in col_indices.items():
-                    try:
-                        value = float(row[idx]) if row[idx].strip() else np.nan
-                        data[col].append(value)
-                    except (ValueError, IndexError):
-                        data[col].append(np.nan)
-
-            # Convert to numpy arrays
-            return {col: np.array(values) for col, values in data.items()}
+        # Find column indices
+        col_indices = {}
+        for col in columns:
+            if col in headers:
+                col_indices[col] = headers.index(col)
+            else:
+                return None, f"Warning: Column '{col}' not found in {filepath.name}"
+
+        # Read data rows with pandas' C parser, only for the needed columns.
+        # Blank lines are skipped and empty cells become NaN. names= fixes
+        # the column count to the header width, so short rows are padded
+        # with NaN instead of shrinking the columns pandas infers.
+        data = {col: [] for col in columns}
+        read_options = dict(
+            header=None,
+            names=range(len(headers)),
+            skiprows=2,
+            usecols=sorted(set(col_indices.values())),
+            na_values=[''],
+            engine='c',
+            encoding='utf-8',
+        )
+
+        def add_chunk(df: pd.DataFrame) -> None:
+            # Convert a parsed chunk to numpy arrays (unparseable cells become NaN)
+            for col, idx in col_indices.items():
+                data[col].append(
+                    pd.to_numeric(df[idx], errors='coerce').to_numpy(dtype=np.float64))
+
+        try:
+            if chunksize is None:
+                add_chunk(pd.read_csv(filepath, **read_options))
+            else:
+                # The context manager closes the file even if a chunk fails
+                with pd.read_csv(filepath, chunksize=chunksize, **read_options) as reader:
+                    for df in reader:
+                        add_chunk(df)
+        except pd.errors.EmptyDataError:
+            # Headers and units only, no data rows
+            pass
+
+        return {
+            col: np.concatenate(arrays) if arrays else np.array([])
+            for col, arrays in data.items()
+        }, None
 
     except Exception as e:
-        print(f"Error loading {filepath}: {e}")
-        return None
+        return None, f"Error loading {filepath}: {e}"
 
 
-def load_csv_files(filepaths: List[Path], columns: List[str]) -> Dict[str, np.ndarray]:
+def load_csv_files(
+    filepaths: List[Path],
+    columns: List[str],
+    chunksize: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
     """
     Load multiple CSV files and combine their data.
     Tracks which test run (file) each data point came from.
@@ -70,6 +120,7 @@ def load_csv_files(filepaths: List[Path], columns: List[str]) -> Dict[str, np.nd
     Args:
         filepaths: List of paths to CSV files
         columns: List of column names to extract
+        chunksize: Rows per parsing chunk, see load_csv_file
 
     Returns:
         Dictionary mapping column names to combined numpy arrays.
@@ -78,23 +129,47 @@ def load_csv_files(filepaths: List[Path], columns: List[str]) -> Dict[str, np.nd
     all_data = {col: [] for col in columns}
     all_data['_test_run_id'] = []  # Track which file each row came from
 
-    for test_run_id, filepath in enumerate(filepaths):
-        file_data = load_csv_file(filepath, columns)
+    # Parse files in threads; pandas' C parser releases the GIL while
+    # tokenizing, so this is expected to overlap on multi-core machines
+    # (not benchmarked). With chunksize set, files are read one at a time
+    # so peak memory stays bounded by a single file's chunk.
+    if chunksize is None:
+        max_workers = max(1, min(len(filepaths), os.cpu_count() or 1))
+    else:
+        max_workers = 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        file_results = list(executor.map(
+            lambda fp: _read_csv_file(fp, columns, chunksize=chunksize),
+            filepaths,
+        ))
+
+    # Report and collect files in order, whatever order they finished in
+    for test_run_id, (filepath, (file_data, message)) in enumerate(
+            zip(filepaths, file_results)):
+        if message is not None:
+            print(message)
         if file_data is not None:
             n_rows = len(file_data[columns[0]])
             for col in columns:
-                all_data[col].extend(file_data[col])
+                all_data[col].append(file_data[col])
             # Add test run ID for each row from this file
-            all_data['_test_run_id'].extend([test_run_id] * n_rows)
+            all_data['_test_run_id'].append(
+                np.full(n_rows, test_run_id, dtype=int))
             print(f"Loaded {filepath.name} (run {test_run_id}): {n_rows} rows")
 
-    # Convert to numpy arrays
-    combined = {col: np.array(values) for col, values in all_data.items()}
+    # Join the per-file arrays into one array per column
+    combined = {
+        col: np.concatenate(arrays) if arrays else np.array([])
+        for col, arrays in all_data.items()
+    }
+
+    # Remove rows with any NaN or infinite values (except for test_run_id)
+    stacked = np.stack([combined[col] for col in columns])
+    valid_mask = np.isfinite(stacked).all(axis=0)
 
-    # Remove rows with any NaN values (except for test_run_id)
-    valid_mask = np.ones(len(combined[columns[0]]), dtype=bool)
-    for col in columns:
-        valid_mask &= ~np.isnan(combined[col])
+    # Nothing to remove, skip copying every column
+    if valid_mask.all():
+        return combined
 
     filtered = {col: combined[col][valid_mask]
                 for col in list(columns) + ['_test_run_id']}
@@ -126,6 +201,11 @@ def filter_valid_data(
         return data
 
     valid_mask = data[bsfc_column] > min_bsfc
+
+    # Nothing to remove, skip copying every column
+    if valid_mask.all():
+        return data
+
     filtered = {col: arr[valid_mask] for col, arr in data.items()}
 
     removed = len(data[bsfc_column]) - len(filtered[bsfc_column])
@@ -185,13 +265,18 @@ def correct_bsfc_for_clutch_slip(
     return corrected_data
 
 
-def load_all_data(data_folder: Path, columns: List[str]) -> Dict[str, np.ndarray]:
+def load_all_data(
+    data_folder: Path,
+    columns: List[str],
+    chunksize: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
     """
     Load all CSV files from a data folder.
 
     Args:
         data_folder: Path to the data folder
         columns: List of column names to extract
+        chunksize: Rows per parsing chunk, see load_csv_file
 
     Returns:
         Dictionary mapping column names to combined numpy arrays
@@ -202,4 +287,4 @@ def load_all_data(data_folder: Path, columns: List[str]) -> Dict[str, np.ndarray
         raise FileNotFoundError(f"No CSV files found in {data_folder}")
 
     print(f"Found {len(csv_files)} CSV file(s) in {data_folder}")
-    return load_csv_files(csv_files, columns)
+    return load_csv_files(csv_files, columns, chunksize=chunksize)
@@ -3,11 +3,11 @@ Results Exporter Module
 Exports optimization results to JSON files
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple
 import numpy as np
+import orjson
 
 from .optimizer import OptimizationResult
 from .rpm_binning import BinnedData, aggregate_binned_data
@@ -35,8 +35,9 @@ def export_results(
     # Create output directory if needed
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate timestamp for unique filename
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    # Generate timestamp for unique filename (also used in the metadata)
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"optimization_results_{timestamp}.json"
     filepath = output_dir / filename
 
@@ -51,7 +52,7 @@ def export_results(
     # Build output structure
     output = {
         "metadata": {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "n_training_samples": result.n_training_samples,
             "training_bounds": result.training_bounds,
         },
@@ -72,9 +73,11 @@ def export_results(
             result.gp_models, binned_data, result
         )
 
-    # Write to file
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2)
+    # Write to file (orjson serializes numpy arrays and scalars natively)
+    filepath.write_bytes(orjson.dumps(
+        output,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+    ))
 
     print(f"\nResults saved to: {filepath}")
 
@@ -88,28 +91,37 @@ def _format_optimal_map(optimal_map: dict) -> dict:
     """
     rpms = sorted(optimal_map.keys())
 
+    # Single pass over the sorted entries to fill all columns
+    rpm_values, lambdas, timings, bsfcs = [], [], [], []
+    for rpm in rpms:
+        entry = optimal_map[rpm]
+        rpm_values.append(int(rpm))
+        lambdas.append(entry["lambda"])
+        timings.append(entry["timing"])
+        bsfcs.append(entry["predicted_bsfc"])
+
     return {
         "format": "1D_map",
         "axis": {
             "name": "RPM",
-            "values": [int(rpm) for rpm in rpms],
+            "values": rpm_values,
             "unit": "rpm",
         },
         "tables": {
             "lambda": {
                 "name": "Fuel Mixture Aim",
                 "unit": "LA",
-                "values": [optimal_map[rpm]["lambda"] for rpm in rpms],
+                "values": lambdas,
             },
             "timing": {
                 "name": "Ignition Timing Main",
                 "unit": "dBTDC",
-                "values": [optimal_map[rpm]["timing"] for rpm in rpms],
+                "values": timings,
             },
             "predicted_bsfc": {
                 "name": "Predicted BSFC",
                 "unit": "",
-                "values": [optimal_map[rpm]["predicted_bsfc"] for rpm in rpms],
+                "values": bsfcs,
             },
         },
     }
@@ -151,24 +163,19 @@ def _generate_visualization_data(
         grid_data["rpm"] = rpm
         surfaces.append(grid_data)
 
-    # Training data points for scatter overlay
-    all_lambda = []
-    all_timing = []
-    all_rpm = []
-    all_bsfc = []
-
-    for rpm_bin in binned_data.bins:
-        all_lambda.extend(rpm_bin.lambda_values.tolist())
-        all_timing.extend(rpm_bin.timing_values.tolist())
-        all_rpm.extend([rpm_bin.rpm_center] * len(rpm_bin.lambda_values))
-        all_bsfc.extend(rpm_bin.bsfc_values.tolist())
-
-    training_points = {
-        "lambda": all_lambda,
-        "timing": all_timing,
-        "rpm": all_rpm,
-        "bsfc": all_bsfc,
-    }
+    # Training data points for scatter overlay (kept as numpy arrays,
+    # orjson serializes them directly)
+    bins = binned_data.bins
+    if bins:
+        training_points = {
+            "lambda": np.concatenate([b.lambda_values for b in bins]),
+            "timing": np.concatenate([b.timing_values for b in bins]),
+            "rpm": np.repeat(binned_data.rpm_centers, [b.n_samples for b in bins]),
+            "bsfc": np.concatenate([b.bsfc_values for b in bins]),
+        }
+    else:
+        training_points = {
+            key: np.empty(0) for key in ("lambda", "timing", "rpm", "bsfc")}
 
     return {
         "surfaces": surfaces,
@@ -198,17 +205,17 @@ def export_ecu_map_csv(
 
     # Lambda map
     lambda_path = output_dir / f"lambda_map_{timestamp}.csv"
-    with open(lambda_path, "w") as f:
-        f.write("RPM,Fuel Mixture Aim (LA)\n")
-        for rpm in rpms:
-            f.write(f"{int(rpm)},{result.optimal_map[rpm]['lambda']}\n")
+    lambda_lines = ["RPM,Fuel Mixture Aim (LA)"] + [
+        f"{int(rpm)},{result.optimal_map[rpm]['lambda']}" for rpm in rpms
+    ]
+    lambda_path.write_text("\n".join(lambda_lines) + "\n")
 
     # Timing map
     timing_path = output_dir / f"timing_map_{timestamp}.csv"
-    with open(timing_path, "w") as f:
-        f.write("RPM,Ignition Timing Main (dBTDC)\n")
-        for rpm in rpms:
-            f.write(f"{int(rpm)},{result.optimal_map[rpm]['timing']}\n")
+    timing_lines = ["RPM,Ignition Timing Main (dBTDC)"] + [
+        f"{int(rpm)},{result.optimal_map[rpm]['timing']}" for rpm in rpms
+    ]
+    timing_path.write_text("\n".join(timing_lines) + "\n")
 
     print(f"ECU maps saved to:")
     print(f"  Lambda: {lambda_path}")
@@ -5,6 +5,8 @@ Surrogate model for BSFC response surface - fits per RPM bin
 
 from typing import Dict, Optional, Tuple
 import numpy as np
+from scipy.linalg import solve_triangular
+from scipy.spatial.distance import cdist
 from sklearn.preprocessing import StandardScaler
 from skopt.learning import GaussianProcessRegressor
 from skopt.learning.gaussian_process.kernels import Matern, ConstantKernel
@@ -66,10 +68,27 @@ class BSFCGaussianProcess:
         X_scaled = self.X_scaler.fit_transform(X)
         y_scaled = self.y_scaler.fit_transform(y.reshape(-1, 1)).ravel()
 
+        # Cache scaler parameters so predict can skip sklearn's input validation
+        self._x_mean = self.X_scaler.mean_.astype(np.float64)
+        self._x_inv_scale = (1.0 / self.X_scaler.scale_).astype(np.float64)
+        self._y_mean = float(self.y_scaler.mean_[0])
+        self._y_scale = float(self.y_scaler.scale_[0])
+
         # Fit GP
         self.gp.fit(X_scaled, y_scaled)
         self.is_fitted = True
 
+        # Cache the fitted posterior so predict can evaluate it directly.
+        # kernel_ is ConstantKernel * Matern(nu=2.5), see __init__.
+        self._signal_var = float(self.gp.kernel_.k1.constant_value)
+        self._length_scale = np.asarray(
+            self.gp.kernel_.k2.length_scale, dtype=np.float64)
+        self._X_train_ls = self.gp.X_train_ / self._length_scale
+        self._L = self.gp.L_
+        self._alpha = self.gp.alpha_
+        self._gp_y_mean = float(self.gp.y_train_mean_[0])
+        self._gp_y_std = float(self.gp.y_train_std_[0])
+
         return self
 
     def predict(self, X: np.ndarray, return_std: bool = True) -> Tuple[np.ndarray, Optional[np.ndarray]]:
@@ -86,26 +105,47 @@ class BSFCGaussianProcess:
         if not self.is_fitted:
             raise RuntimeError("Model must be fitted before prediction")
 
-        X_scaled = self.X_scaler.transform(X)
+        X_scaled = (X - self._x_mean) * self._x_inv_scale
 
-        if return_std:
-            mean_scaled, std_scaled = self.gp.predict(
-                X_scaled, return_std=True)
+        # Posterior mean: K(X, X_train) @ alpha
+        K_trans = self._cross_kernel(X_scaled)
+        mean_scaled = K_trans @ self._alpha
+        mean_scaled = mean_scaled * self._gp_y_std + self._gp_y_mean
 
-            # Inverse transform predictions
-            mean = self.y_scaler.inverse_transform(
-                mean_scaled.reshape(-1, 1)).ravel()
+        # Inverse transform predictions
+        mean = mean_scaled * self._y_scale + self._y_mean
 
-            # Scale std by the y scaler's scale
-            std = std_scaled * self.y_scaler.scale_[0]
-
-            return mean, std
-        else:
-            mean_scaled = self.gp.predict(X_scaled, return_std=False)
-            mean = self.y_scaler.inverse_transform(
-                mean_scaled.reshape(-1, 1)).ravel()
+        if not return_std:
             return mean, None
 
+        # Posterior variance: k(x, x) - v^T v with v = L^-1 K(X_train, X)
+        v = solve_triangular(self._L, K_trans.T, lower=True, check_finite=False)
+        var_scaled = self._signal_var - np.einsum("ij,ij->j", v, v)
+
+        # Clip small negative variances caused by round-off
+        np.maximum(var_scaled, 0.0, out=var_scaled)
+        std_scaled = np.sqrt(var_scaled) * self._gp_y_std
+
+        # Scale std by the y scaler's scale
+        std = std_scaled * self._y_scale
+
+        return mean, std
+
+    def _cross_kernel(self, X_scaled: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the fitted ConstantKernel * Matern(nu=2.5) between query
+        points and the training inputs.
+
+        Args:
+            X_scaled: Standardized query points, shape (n_points, 2)
+
+        Returns:
+            Kernel matrix, shape (n_points, n_train)
+        """
+        r = cdist(X_scaled / self._length_scale, self._X_train_ls)
+        r *= np.sqrt(5.0)
+        return self._signal_var * (1.0 + r + r * r / 3.0) * np.exp(-r)
+
     def predict_grid(
         self,
         lambda_range: Tuple[float, float],
@@ -122,7 +162,7 @@ class BSFCGaussianProcess:
             n_points: Number of points per dimension
 
         Returns:
-            Dictionary with grid data for plotting
+            Dictionary with grid data for plotting (as numpy arrays)
         """
         lambda_vals = np.linspace(lambda_range[0], lambda_range[1], n_points)
         timing_vals = np.linspace(timing_range[0], timing_range[1], n_points)
@@ -136,10 +176,10 @@ class BSFCGaussianProcess:
         mean, std = self.predict(X_grid, return_std=True)
 
         return {
-            "lambda": lambda_vals.tolist(),
-            "timing": timing_vals.tolist(),
-            "bsfc_mean": mean.reshape(n_points, n_points).tolist(),
-            "bsfc_std": std.reshape(n_points, n_points).tolist(),
+            "lambda": lambda_vals,
+            "timing": timing_vals,
+            "bsfc_mean": mean.reshape(n_points, n_points),
+            "bsfc_std": std.reshape(n_points, n_points),
         }
 
     def get_training_bounds(self) -> dict:
@@ -6,8 +6,9 @@ Finds optimal Lambda and Timing parameters for each RPM bin independently
 import warnings
 from typing import Dict, List, Optional, Tuple
 import numpy as np
+from joblib import Parallel, delayed
 from scipy.optimize import minimize
-from scipy.stats import norm
+from scipy.special import ndtr
 from dataclasses import dataclass
 
 from .gp_model import BSFCGaussianProcess
@@ -17,6 +18,12 @@ from .rpm_binning import BinnedData, RPMBin
 # If variance is below this, we use the observed best instead of optimizing
 MIN_VARIANCE_THRESHOLD = 0.01
 
+# Grid points per dimension for the coarse search in _optimize_for_bin
+OPTIMIZATION_GRID_POINTS = 64
+
+# Normalization constant of the standard normal pdf
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
 
 @dataclass
 class OptimizationResult:
@@ -49,6 +56,7 @@ class BSFCOptimizer:
         timing_bounds: Optional[Tuple[float, float]] = None,
         n_suggestions: int = 5,
         noise_level: float = 0.1,
+        n_jobs: int = 1,
     ):
         """
         Initialize the optimizer.
@@ -58,15 +66,29 @@ class BSFCOptimizer:
             timing_bounds: (min, max) bounds for timing optimization
             n_suggestions: Number of next experiments to suggest
             noise_level: GP noise level
+            n_jobs: Number of worker threads for per-bin fitting
+                (1 = serial, -1 = all cores). API only: main.py runs
+                serially, and GP fitting mostly holds the GIL
         """
         self.lambda_bounds = lambda_bounds
         self.timing_bounds = timing_bounds
         self.n_suggestions = n_suggestions
         self.noise_level = noise_level
+        self.n_jobs = n_jobs
 
         # Will store fitted GP models per RPM bin
         self.gp_models: Dict[float, BSFCGaussianProcess] = {}
 
+        # Search grid on the unit square, shared by all bins and rescaled
+        # to each bin's bounds in _optimize_for_bin
+        u = np.linspace(0.0, 1.0, OPTIMIZATION_GRID_POINTS)
+        U_l, U_t = np.meshgrid(u, u)
+        self._unit_grid = np.column_stack([U_l.ravel(), U_t.ravel()])
+
+        # Seed for candidate sampling; each bin gets its own child stream so
+        # results do not depend on how bins are scheduled across workers
+        self._seed_seq = np.random.SeedSequence(42)
+
     def _fit_gp_for_bin(self, rpm_bin: RPMBin) -> BSFCGaussianProcess:
         """
         Fit a GP model for a single RPM bin.
@@ -79,10 +101,10 @@ class BSFCOptimizer:
         """
         gp = BSFCGaussianProcess(noise_level=self.noise_level, n_restarts=5)
 
-        # Suppress convergence warnings - they're expected with low-variance data
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=Warning)
-            gp.fit(rpm_bin.X, rpm_bin.y)
+        # Convergence warnings are expected with low-variance data. They are
+        # suppressed once in optimize(), since catch_warnings is not
+        # thread-safe and this runs in joblib worker threads.
+        gp.fit(rpm_bin.X, rpm_bin.y)
 
         return gp
 
@@ -143,8 +165,8 @@ class BSFCOptimizer:
 
     def _expected_improvement(
         self,
-        gp: BSFCGaussianProcess,
-        X: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
         best_y: float,
         xi: float = 0.01,
     ) -> np.ndarray:
@@ -152,43 +174,49 @@ class BSFCOptimizer:
         Compute Expected Improvement acquisition function.
 
         Args:
-            gp: The GP model for this bin
-            X: Query points, shape (n_points, 2) for [lambda, timing]
+            mean: GP predicted mean at the query points, shape (n_points,)
+            std: GP predicted std at the query points, shape (n_points,)
             best_y: Current best (minimum) observed BSFC
             xi: Exploration-exploitation trade-off parameter
 
         Returns:
             EI values, shape (n_points,)
         """
-        mean, std = gp.predict(X, return_std=True)
-
         # Improvement is when we find values LOWER than best (minimization)
         improvement = best_y - mean - xi
 
         # Handle numerical issues
-        std = np.maximum(std, 1e-9)
+        safe_std = np.maximum(std, 1e-9)
 
-        Z = improvement / std
-        ei = improvement * norm.cdf(Z) + std * norm.pdf(Z)
+        Z = improvement / safe_std
 
-        # Set EI to 0 where std is essentially 0
-        ei[std < 1e-9] = 0.0
+        # EI = improvement * cdf(Z) + std * pdf(Z), evaluated in place with
+        # scipy.special.ndtr to avoid scipy.stats' per-call dispatch overhead
+        weighted_pdf = np.exp(-0.5 * Z * Z)
+        weighted_pdf *= safe_std
+        weighted_pdf *= _INV_SQRT_2PI
 
-        return ei
+        ei = ndtr(Z)
+        ei *= improvement
+        ei += weighted_pdf
+
+        # EI is 0 where std is essentially 0
+        return np.where(std >= 1e-9, ei, 0.0)
 
     def _optimize_for_bin(
         self,
         gp: BSFCGaussianProcess,
         rpm_bin: RPMBin,
-        n_restarts: int = 10,
     ) -> Tuple[float, float, float, float, str]:
         """
         Find optimal (lambda, timing) for a specific RPM bin.
 
+        Evaluates the GP on a dense grid over the bounds in a single batched
+        prediction, then polishes the best grid point with L-BFGS-B.
+
         Args:
             gp: Fitted GP model for this bin
             rpm_bin: The RPM bin data
-            n_restarts: Number of optimization restarts
 
         Returns:
             Tuple of (optimal_lambda, optimal_timing, predicted_bsfc, uncertainty, notes)
@@ -215,26 +243,25 @@ class BSFCOptimizer:
             mean, _ = gp.predict(X, return_std=False)
             return mean[0]
 
-        best_result = None
-        best_value = np.inf
-
-        for _ in range(n_restarts):
-            # Random starting point
-            x0 = [
-                np.random.uniform(*l_bounds),
-                np.random.uniform(*t_bounds),
-            ]
-
-            result = minimize(
-                objective,
-                x0,
-                method="L-BFGS-B",
-                bounds=bounds,
-            )
+        # Coarse search: predict the whole grid at once and take the minimum
+        lower = np.array([l_bounds[0], t_bounds[0]])
+        upper = np.array([l_bounds[1], t_bounds[1]])
+        X_grid = lower + self._unit_grid * (upper - lower)
+        grid_mean, _ = gp.predict(X_grid, return_std=False)
+        grid_idx = np.argmin(grid_mean)
+
+        # Local refinement starting from the best grid point
+        best_result = minimize(
+            objective,
+            X_grid[grid_idx],
+            method="L-BFGS-B",
+            bounds=bounds,
+        )
+        best_value = best_result.fun
 
-            if result.fun < best_value:
-                best_value = result.fun
-                best_result = result
+        if grid_mean[grid_idx] < best_value:
+            best_result.x = X_grid[grid_idx]
+            best_value = grid_mean[grid_idx]
 
         # Get uncertainty at optimal point
         opt_X = np.array([[best_result.x[0], best_result.x[1]]])
@@ -254,6 +281,7 @@ class BSFCOptimizer:
         self,
         gp: BSFCGaussianProcess,
         rpm_bin: RPMBin,
+        rng: np.random.Generator,
         n_candidates: int = 500,
     ) -> Optional[dict]:
         """
@@ -262,6 +290,7 @@ class BSFCOptimizer:
         Args:
             gp: Fitted GP model for this bin
             rpm_bin: The RPM bin data
+            rng: Random generator used to draw candidates
             n_candidates: Number of random candidates to evaluate
 
         Returns:
@@ -274,28 +303,51 @@ class BSFCOptimizer:
         if not lambda_has_var and not timing_has_var:
             return None
 
-        # Generate random candidates
-        lambdas = np.random.uniform(l_bounds[0], l_bounds[1], n_candidates)
-        timings = np.random.uniform(t_bounds[0], t_bounds[1], n_candidates)
-        X = np.column_stack([lambdas, timings])
+        # Generate random candidates, both dimensions in a single draw
+        X = rng.uniform(
+            low=[l_bounds[0], t_bounds[0]],
+            high=[l_bounds[1], t_bounds[1]],
+            size=(n_candidates, 2),
+        )
 
         # Compute EI
         best_bsfc = rpm_bin.min_bsfc
-        ei = self._expected_improvement(gp, X, best_bsfc)
+        mean, std = gp.predict(X, return_std=True)
+        ei = self._expected_improvement(mean, std, best_bsfc)
 
-        # Get top candidate (best EI)
+        # Get top candidate (best EI), reusing its prediction from above
         best_idx = np.argmax(ei)
-        mean, std = gp.predict(X[best_idx:best_idx+1], return_std=True)
 
         return {
             "rpm": round(rpm_bin.rpm_center, 0),
             "lambda": round(float(X[best_idx, 0]), 4),
             "timing": round(float(X[best_idx, 1]), 2),
-            "predicted_bsfc": round(float(mean[0]), 4),
-            "uncertainty": round(float(std[0]), 4),
+            "predicted_bsfc": round(float(mean[best_idx]), 4),
+            "uncertainty": round(float(std[best_idx]), 4),
             "expected_improvement": round(float(ei[best_idx]), 6),
         }
 
+    def _process_bin(
+        self,
+        rpm_bin: RPMBin,
+        rng: np.random.Generator,
+    ) -> Tuple[BSFCGaussianProcess, Tuple[float, float, float, float, str], Optional[dict]]:
+        """
+        Fit, optimize and find the next experiment for a single RPM bin.
+        Bins are independent, so this can run in joblib worker threads.
+
+        Args:
+            rpm_bin: The RPM bin data
+            rng: Random generator for this bin's candidate sampling
+
+        Returns:
+            Tuple of (fitted GP, _optimize_for_bin result, suggested experiment or None)
+        """
+        gp = self._fit_gp_for_bin(rpm_bin)
+        optimum = self._optimize_for_bin(gp, rpm_bin)
+        suggestion = self._find_best_experiments_for_bin(gp, rpm_bin, rng)
+        return gp, optimum, suggestion
+
     def optimize(self, binned_data: BinnedData) -> OptimizationResult:
         """
         Run full optimization: fit GP per bin and find optimal parameters.
@@ -309,42 +361,76 @@ class BSFCOptimizer:
         print(
             f"\nOptimizing for {binned_data.n_bins} RPM bins (fitting separate GP per bin)...")
 
-        optimal_map = {}
         best_bsfc_per_rpm = {}
         all_suggestions = []
 
-        for rpm_bin in binned_data.bins:
-            rpm = rpm_bin.rpm_center
+        # Per-bin optimum as columns: lambda, timing, predicted BSFC, uncertainty
+        optima = np.empty((binned_data.n_bins, 4))
+        notes_per_bin = []
+
+        bin_rngs = [
+            np.random.default_rng(seed)
+            for seed in self._seed_seq.spawn(binned_data.n_bins)
+        ]
+
+        # Bins are independent. Parallelism is opt-in through n_jobs and uses
+        # threads. Results are yielded in bin order as they finish, so each
+        # bin is reported as soon as it is done.
+        #
+        # GP convergence warnings are expected with low-variance data and are
+        # suppressed once here rather than per worker, because
+        # catch_warnings is not thread-safe. The filter is process-wide, so
+        # it also covers the worker threads while the results are consumed.
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=Warning)
+
+            bin_results = Parallel(
+                n_jobs=self.n_jobs, prefer="threads", return_as="generator"
+            )(
+                delayed(self._process_bin)(rpm_bin, rng)
+                for rpm_bin, rng in zip(binned_data.bins, bin_rngs)
+            )
 
-            print(f"\n  RPM {rpm:.0f}: {rpm_bin.n_samples} samples, "
-                  f"λ=[{rpm_bin.lambda_range[0]:.3f}-{rpm_bin.lambda_range[1]:.3f}], "
-                  f"timing=[{rpm_bin.timing_range[0]:.1f}-{rpm_bin.timing_range[1]:.1f}]")
+            for i, (rpm_bin, (gp, optimum, suggestion)) in enumerate(
+                    zip(binned_data.bins, bin_results)):
+                rpm = rpm_bin.rpm_center
 
-            # Fit GP for this bin
-            gp = self._fit_gp_for_bin(rpm_bin)
-            self.gp_models[rpm] = gp
+                print(f"\n  RPM {rpm:.0f}: {rpm_bin.n_samples} samples, "
+                      f"λ=[{rpm_bin.lambda_range[0]:.3f}-{rpm_bin.lambda_range[1]:.3f}], "
+                      f"timing=[{rpm_bin.timing_range[0]:.1f}-{rpm_bin.timing_range[1]:.1f}]")
 
-            # Optimize for this bin
-            opt_lambda, opt_timing, pred_bsfc, uncertainty, notes = self._optimize_for_bin(
-                gp, rpm_bin)
+                self.gp_models[rpm] = gp
+                opt_lambda, opt_timing, pred_bsfc, uncertainty, notes = optimum
+                optima[i] = optimum[:4]
+                notes_per_bin.append(notes)
 
-            optimal_map[float(rpm)] = {
-                "lambda": round(opt_lambda, 4),
-                "timing": round(opt_timing, 2),
-                "predicted_bsfc": round(pred_bsfc, 4),
-                "uncertainty": round(uncertainty, 4),
-                "notes": notes,
-            }
+                best_bsfc_per_rpm[rpm] = float(rpm_bin.min_bsfc)
 
-            best_bsfc_per_rpm[rpm] = float(rpm_bin.min_bsfc)
+                print(f"    Optimal: λ={opt_lambda:.3f}, timing={opt_timing:.1f}°, "
+                      f"BSFC={pred_bsfc:.4f} ± {uncertainty:.4f} ({notes})")
 
-            print(f"    Optimal: λ={opt_lambda:.3f}, timing={opt_timing:.1f}°, "
-                  f"BSFC={pred_bsfc:.4f} ± {uncertainty:.4f} ({notes})")
+                # Suggestion for this bin (1 per bin)
+                if suggestion is not None:
+                    all_suggestions.append(suggestion)
 
-            # Get suggestion for this bin (1 per bin)
-            suggestion = self._find_best_experiments_for_bin(gp, rpm_bin)
-            if suggestion is not None:
-                all_suggestions.append(suggestion)
+        # Round all bins at once and build the optimal map from the columns
+        optimal_map = {
+            float(rpm_bin.rpm_center): {
+                "lambda": opt_lambda,
+                "timing": opt_timing,
+                "predicted_bsfc": pred_bsfc,
+                "uncertainty": uncertainty,
+                "notes": notes,
+            }
+            for rpm_bin, opt_lambda, opt_timing, pred_bsfc, uncertainty, notes in zip(
+                binned_data.bins,
+                np.round(optima[:, 0], 4).tolist(),
+                np.round(optima[:, 1], 2).tolist(),
+                np.round(optima[:, 2], 4).tolist(),
+                np.round(optima[:, 3], 4).tolist(),
+                notes_per_bin,
+            )
+        }
 
         # Sort suggestions by RPM for consistent ordering
         all_suggestions.sort(key=lambda x: x["rpm"])
@@ -355,16 +441,11 @@ class BSFCOptimizer:
 
         print(f"\n  Best observed BSFC across all bins: {overall_best:.4f}")
 
-        # Build training bounds from all data
-        all_lambda = np.concatenate(
-            [b.lambda_values for b in binned_data.bins])
-        all_timing = np.concatenate(
-            [b.timing_values for b in binned_data.bins])
-
+        # Training bounds from all data (precomputed by BinnedData)
         training_bounds = {
-            "lambda": (float(all_lambda.min()), float(all_lambda.max())),
-            "timing": (float(all_timing.min()), float(all_timing.max())),
-            "rpm": (float(binned_data.rpm_centers.min()), float(binned_data.rpm_centers.max())),
+            "lambda": binned_data.lambda_range,
+            "timing": binned_data.timing_range,
+            "rpm": binned_data.rpm_range,
         }
 
         return OptimizationResult(
@@ -4,9 +4,9 @@ Groups dyno data into discrete RPM intervals, keeping individual test points
 for proper GP fitting within each bin.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -48,34 +48,67 @@ class RPMBin:
 
 @dataclass
 class BinnedData:
-    """Container for all RPM bins"""
+    """
+    Container for all RPM bins.
+
+    The rpm/lambda/timing/bsfc ranges are computed once in __post_init__ and
+    describe only the bins present at construction. Build a new BinnedData
+    instead of adding or removing entries in bins afterwards.
+    """
     bins: List[RPMBin]
     bin_width: int
 
+    # Range summaries over all bins, computed once in __post_init__
+    rpm_range: Tuple[float, float] = field(init=False)
+    lambda_range: Tuple[float, float] = field(init=False)
+    timing_range: Tuple[float, float] = field(init=False)
+    bsfc_range: Tuple[float, float] = field(init=False)
+
+    def __post_init__(self):
+        if not self.bins:
+            self.rpm_range = self.lambda_range = (0.0, 0.0)
+            self.timing_range = self.bsfc_range = (0.0, 0.0)
+            return
+
+        def value_range(values: np.ndarray) -> Tuple[float, float]:
+            return (float(values.min()), float(values.max()))
+
+        self.rpm_range = value_range(self.rpm_centers)
+        self.lambda_range = value_range(
+            np.concatenate([b.lambda_values for b in self.bins]))
+        self.timing_range = value_range(
+            np.concatenate([b.timing_values for b in self.bins]))
+        self.bsfc_range = value_range(
+            np.concatenate([b.bsfc_values for b in self.bins]))
+
+    @property
+    def total_samples(self) -> int:
+        return sum(b.n_samples for b in self.bins)
+
+    def _per_bin(self, values) -> np.ndarray:
+        """Fill a preallocated float array with one value per bin"""
+        return np.fromiter(values, dtype=np.float64, count=len(self.bins))
+
     @property
     def rpm_centers(self) -> np.ndarray:
-        return np.array([b.rpm_center for b in self.bins])
+        return self._per_bin(b.rpm_center for b in self.bins)
 
     @property
     def n_bins(self) -> int:
         return len(self.bins)
 
-    @property
-    def total_samples(self) -> int:
-        return sum(b.n_samples for b in self.bins)
-
     # For backward compatibility with old code
     @property
     def bsfc_values(self) -> np.ndarray:
-        return np.array([b.mean_bsfc for b in self.bins])
+        return self._per_bin(b.mean_bsfc for b in self.bins)
 
     @property
     def lambda_values(self) -> np.ndarray:
-        return np.array([np.mean(b.lambda_values) for b in self.bins])
+        return self._per_bin(np.mean(b.lambda_values) for b in self.bins)
 
     @property
     def timing_values(self) -> np.ndarray:
-        return np.array([np.mean(b.timing_values) for b in self.bins])
+        return self._per_bin(np.mean(b.timing_values) for b in self.bins)
 
     def get_bin_by_rpm(self, rpm: float) -> Optional[RPMBin]:
         """Find the bin containing the given RPM"""
@@ -138,57 +171,79 @@ def bin_by_rpm(
     if rpm_max is None:
         rpm_max = int(np.ceil(rpm.max() / bin_width) * bin_width)
 
-    # Create bin edges
-    bin_edges = np.arange(rpm_min, rpm_max + bin_width, bin_width)
-
-    # Assign each data point to a bin
-    bin_indices = np.digitize(rpm, bin_edges) - 1
+    # Uniform bins: bin i covers [rpm_min + i*bin_width, rpm_min + (i+1)*bin_width)
+    n_bins = max(int(np.ceil((rpm_max - rpm_min) / bin_width)), 0)
+
+    # Assign each data point to a bin with one subtract and floor-divide
+    # (no edge search needed), done in place in a single buffer
+    bin_indices = np.subtract(rpm, rpm_min, dtype=np.float64)
+    np.floor_divide(bin_indices, bin_width, out=bin_indices)
+
+    # Drop points outside the range once, up front, so every later pass
+    # streams over the in-range samples only, and skip the copies when every
+    # sample is in range. Even an auto-detected range drops samples at
+    # exactly rpm_max (a max RPM that is a multiple of bin_width), whose
+    # index equals n_bins.
+    in_range = (bin_indices >= 0) & (bin_indices < n_bins)
+    if not in_range.all():
+        bin_indices = bin_indices[in_range]
+        lambda_vals = lambda_vals[in_range]
+        timing = timing[in_range]
+        bsfc = bsfc[in_range]
+        test_run_ids = test_run_ids[in_range]
+    bin_indices = bin_indices.astype(np.intp)
+
+    # Map test run IDs to 0..n_runs-1 (sorted, like np.unique per bin)
+    _, run_indices = np.unique(test_run_ids, return_inverse=True)
+    n_runs = int(run_indices.max()) + 1 if len(run_indices) else 0
+
+    # One group per (bin, test run) pair. Each per-group sum is a single
+    # bincount pass over the data instead of a boolean mask per bin and run.
+    groups = bin_indices * n_runs + run_indices
+    n_groups = n_bins * n_runs
+
+    def group_sums(values: np.ndarray) -> np.ndarray:
+        return np.bincount(
+            groups, weights=values, minlength=n_groups
+        ).reshape(n_bins, n_runs)
+
+    counts = np.bincount(groups, minlength=n_groups).reshape(n_bins, n_runs)
+    runs_present = counts > 0
+
+    # Average each test run's data within each bin
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_lambdas = group_sums(lambda_vals) / counts
+        avg_timings = group_sums(timing) / counts
+        avg_bsfcs = group_sums(bsfc) / counts
+
+    # Keep bins with enough test runs (and at least one) in a single mask
+    n_samples_per_bin = runs_present.sum(axis=1)
+    keep = (n_samples_per_bin > 0) & (n_samples_per_bin >= min_samples)
+    kept_indices = np.flatnonzero(keep)
+    bin_starts = rpm_min + kept_indices * bin_width
 
     # Create bins with per-test-run averaged data points
     bins = []
 
-    for i in range(len(bin_edges) - 1):
-        bin_mask = bin_indices == i
-
-        if bin_mask.sum() == 0:
-            continue
-
-        # Get unique test runs in this bin
-        runs_in_bin = np.unique(test_run_ids[bin_mask])
-
-        # Average each test run's data within this bin
-        avg_lambdas = []
-        avg_timings = []
-        avg_bsfcs = []
-
-        for run_id in runs_in_bin:
-            run_mask = bin_mask & (test_run_ids == run_id)
-            if run_mask.sum() > 0:
-                avg_lambdas.append(lambda_vals[run_mask].mean())
-                avg_timings.append(timing[run_mask].mean())
-                avg_bsfcs.append(bsfc[run_mask].mean())
-
-        # Number of test runs with data in this bin
-        n_samples = len(avg_lambdas)
-
-        if n_samples >= min_samples:
-            bin_lambda = np.array(avg_lambdas)
-            bin_timing = np.array(avg_timings)
-            bin_bsfc = np.array(avg_bsfcs)
-
-            # Create 2D training data for this bin's GP
-            X = np.column_stack([bin_lambda, bin_timing])
-
-            bins.append(RPMBin(
-                rpm_center=float((bin_edges[i] + bin_edges[i + 1]) / 2),
-                rpm_min=float(bin_edges[i]),
-                rpm_max=float(bin_edges[i + 1]),
-                lambda_values=bin_lambda,
-                timing_values=bin_timing,
-                bsfc_values=bin_bsfc,
-                X=X,
-                y=bin_bsfc,
-            ))
+    for i, bin_start in zip(kept_indices, bin_starts):
+        present = runs_present[i]
+        bin_lambda = avg_lambdas[i, present]
+        bin_timing = avg_timings[i, present]
+        bin_bsfc = avg_bsfcs[i, present]
+
+        # Create 2D training data for this bin's GP
+        X = np.column_stack([bin_lambda, bin_timing])
+
+        bins.append(RPMBin(
+            rpm_center=float(bin_start + bin_width / 2),
+            rpm_min=float(bin_start),
+            rpm_max=float(bin_start + bin_width),
+            lambda_values=bin_lambda,
+            timing_values=bin_timing,
+            bsfc_values=bin_bsfc,
+            X=X,
+            y=bin_bsfc,
+        ))
 
     return BinnedData(bins=bins, bin_width=bin_width)
 
@@ -214,16 +269,13 @@ def aggregate_binned_data(binned: BinnedData) -> dict:
             "bsfc_range": [0, 0],
         }
 
-    all_lambda = np.concatenate([b.lambda_values for b in binned.bins])
-    all_timing = np.concatenate([b.timing_values for b in binned.bins])
-    all_bsfc = np.concatenate([b.bsfc_values for b in binned.bins])
-
+    # Ranges are precomputed when the BinnedData is constructed
     return {
         "n_bins": binned.n_bins,
-        "rpm_range": [float(binned.rpm_centers.min()), float(binned.rpm_centers.max())],
+        "rpm_range": list(binned.rpm_range),
         "total_samples": binned.total_samples,
         "avg_samples_per_bin": binned.total_samples / binned.n_bins,
-        "lambda_range": [float(all_lambda.min()), float(all_lambda.max())],
-        "timing_range": [float(all_timing.min()), float(all_timing.max())],
-        "bsfc_range": [float(all_bsfc.min()), float(all_bsfc.max())],
+        "lambda_range": list(binned.lambda_range),
+        "timing_range": list(binned.timing_range),
+        "bsfc_range": list(binned.bsfc_range),
     }